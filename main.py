@@ -2,6 +2,7 @@ import os
 import streamlit as st
 from dotenv import load_dotenv
 
+from src.llm import LLMClient
 from src.strategies.ibis import IBISStrategy
 from src.strategies.toulmin import ToulminStrategy
 from src.visualizer import MermaidGenerator
@@ -16,6 +17,21 @@ def load_sample_file(filename):
             return f.read()
     return ""
 
+@st.cache_resource
+def get_llm(api_key):
+    # OpenAIクライアントは再実行のたびに作り直さず使い回す
+    # (APIキーごとにキャッシュし、後からキーが設定された場合も作り直されるようにする)
+    return LLMClient()
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def run_analysis(strategy_option, text):
+    # 同じモデル・同じテキストならLLMを呼ばずにキャッシュを返す
+    if "IBIS" in strategy_option:
+        strategy = IBISStrategy(llm=get_llm(os.getenv("OPENAI_API_KEY")))
+    else:
+        strategy = ToulminStrategy()
+    return strategy.analyze(text)
+
 def main():
     st.set_page_config(page_title="Argument Miner", layout="wide")
     st.subheader("🧩 議論構造可視化 (Argument Structure)")
@@ -63,14 +79,8 @@ def main():
             else:
                 try:
                     with st.spinner('AIが分析中...'):
-                        # 分析実行
-                        if "IBIS" in strategy_option:
-                            strategy = IBISStrategy()
-                        else:
-                            strategy = ToulminStrategy()
-                        
-                        # ★ここが重要: 結果をセッションステートに保存
-                        st.session_state["graph_data"] = strategy.analyze(text_area_val)
+                        # 分析実行 (★ここが重要: 結果をセッションステートに保存)
+                        st.session_state["graph_data"] = run_analysis(strategy_option, text_area_val)
                         
                 except Exception as e:
                     st.error(f"エラー: {e}")
@@ -83,27 +93,31 @@ def main():
     if st.session_state["graph_data"]:
         graph = st.session_state["graph_data"]
         
-        # Mermaid生成 (LR: 横向き)
-        mermaid_code = MermaidGenerator.generate(graph, direction="LR")
-        
-        # 凡例
-        st.markdown("""
-        <div style="background-color:#f8f9fa; padding:15px; border-radius:8px; border:1px solid #ddd; margin-bottom:20px;">
-            <h5 style="margin:0 0 10px 0;">💡 図の見方 (Legend)</h5>
-            <span style="margin-right:15px;">🟡 <b>論点</b> ((丸))</span>
-            <span style="margin-right:15px;">🔵 <b>提案</b> [四角]</span>
-            <span style="margin-right:15px;">⚪ <b>根拠</b> >タグ]</span>
-            <span style="margin-right:15px;">🟢 <b>決定</b> {{六角}}</span>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # ボーダー付きコンテナで描画
-        with st.container(border=True):
-            st.caption("📊 議論構造図")
-            st_mermaid(mermaid_code, height=2000)
+        # ノードがない場合は凡例・図の生成・描画自体を行わない
+        if graph.nodes:
+            # Mermaid生成 (LR: 横向き)
+            mermaid_code = MermaidGenerator.generate(graph, direction="LR")
+
+            # 凡例
+            st.markdown("""
+            <div style="background-color:#f8f9fa; padding:15px; border-radius:8px; border:1px solid #ddd; margin-bottom:20px;">
+                <h5 style="margin:0 0 10px 0;">💡 図の見方 (Legend)</h5>
+                <span style="margin-right:15px;">🟡 <b>論点</b> ((丸))</span>
+                <span style="margin-right:15px;">🔵 <b>提案</b> [四角]</span>
+                <span style="margin-right:15px;">⚪ <b>根拠</b> >タグ]</span>
+                <span style="margin-right:15px;">🟢 <b>決定</b> {{六角}}</span>
+            </div>
+            """, unsafe_allow_html=True)
+
+            # ボーダー付きコンテナで描画
+            with st.container(border=True):
+                st.caption("📊 議論構造図")
+                st_mermaid(mermaid_code, height=2000)
+        else:
+            st.info("ノードが抽出されませんでした。")
         
         with st.expander("詳細データを見る"):
-            st.json(graph.model_dump())
+            st.json(graph.model_dump_json())
 
     else:
         # データがない時の案内
@@ -1,10 +1,15 @@
+from typing import Optional
 from src.strategies.base import MiningStrategy
 from src.models import ArgumentGraph
 from src.llm import LLMClient
 
 class IBISStrategy(MiningStrategy):
+    def __init__(self, llm: Optional[LLMClient] = None):
+        # クライアントを外から渡せるようにして、使い回しできるようにする
+        self.llm = llm
+
     def analyze(self, text: str) -> ArgumentGraph:
-        llm = LLMClient()
+        llm = self.llm or LLMClient()
         
         # プロンプトを日本語指示向けに調整
         system_prompt = """
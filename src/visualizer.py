@@ -1,6 +1,24 @@
 import textwrap
 from src.models import ArgumentGraph
 
+# ノードタイプごとの (開き括弧, 閉じ括弧, スタイル) を事前に定義しておく
+NODE_STYLES = {
+    # 丸形 ((Text)) - 黄色系
+    "issue": ("((", "))", "fill:#fff3cd,stroke:#d6b656,stroke-width:4px,color:#333"),
+    # 六角形 {{Text}} - 緑系
+    "decision": ("{{", "}}", "fill:#d4edda,stroke:#155724,stroke-width:4px,color:#155724"),
+    # タグ型 >Text] - グレー系
+    "argument": (">", "]", "fill:#f8f9fa,stroke:#6c757d,stroke-width:2px,stroke-dasharray: 5 5,color:#555"),
+    # 四角 [Text] - 青系
+    "position": ("[", "]", "fill:#cce5ff,stroke:#b8daff,stroke-width:2px,color:#004085"),
+}
+
+# Mermaid記法と衝突する文字の置換表 (1回の translate でまとめて置換する)
+MERMAID_ESCAPE_TABLE = str.maketrans({'"': "'", "(": "（", ")": "）"})
+
+# textwrap.wrap は呼び出しごとに TextWrapper を生成するため、1つを使い回す
+LABEL_WRAPPER = textwrap.TextWrapper(width=15)
+
 class MermaidGenerator:
     @staticmethod
     def generate(graph: ArgumentGraph, direction: str = "TD") -> str:
@@ -8,14 +26,17 @@ class MermaidGenerator:
         ArgumentGraphデータをMermaid記法の文字列に変換する。
         """
         lines = [f"graph {direction}"]
+
+        # 0. タイプごとのスタイルは classDef で1回だけ定義する
+        lines.extend(f"    classDef {node_type} {style}" for node_type, (_, _, style) in NODE_STYLES.items())
         
         # 1. ノードの定義
         for node in graph.nodes:
             # エラー回避: ダブルクォート等を置換
-            safe_content = node.content.replace('"', "'").replace("(", "（").replace(")", "）")
+            safe_content = node.content.translate(MERMAID_ESCAPE_TABLE)
             
             # ★変更点: 15文字ごとに <br/> で改行を入れる
-            wrapped_content_list = textwrap.wrap(safe_content, width=15)
+            wrapped_content_list = LABEL_WRAPPER.wrap(safe_content)
             wrapped_content = "<br/>".join(wrapped_content_list)
             
             # 表示テキスト作成
@@ -23,26 +44,10 @@ class MermaidGenerator:
             if node.speaker:
                 display_text += f"<br/><small>by {node.speaker}</small>"
             
-            # ノードタイプに応じた形状と色の定義
-            if node.type == "issue":
-                # 丸形 ((Text)) - 黄色系
-                lines.append(f'    {node.id}(("{display_text}"))')
-                lines.append(f'    style {node.id} fill:#fff3cd,stroke:#d6b656,stroke-width:4px,color:#333')
-                
-            elif node.type == "decision":
-                # 六角形 {{Text}} - 緑系
-                lines.append(f'    {node.id}{{{{"{display_text}"}}}}')
-                lines.append(f'    style {node.id} fill:#d4edda,stroke:#155724,stroke-width:4px,color:#155724')
-                
-            elif node.type == "argument":
-                # タグ型 >Text] - グレー系
-                lines.append(f'    {node.id}>"{display_text}"]')
-                lines.append(f'    style {node.id} fill:#f8f9fa,stroke:#6c757d,stroke-width:2px,stroke-dasharray: 5 5,color:#555')
-                
-            else: # position
-                # 四角 [Text] - 青系
-                lines.append(f'    {node.id}["{display_text}"]')
-                lines.append(f'    style {node.id} fill:#cce5ff,stroke:#b8daff,stroke-width:2px,color:#004085')
+            # ノードタイプに応じた形状とクラスの割り当て (未知のタイプは position 扱い)
+            node_type = node.type if node.type in NODE_STYLES else "position"
+            open_bracket, close_bracket, _ = NODE_STYLES[node_type]
+            lines.append(f'    {node.id}{open_bracket}"{display_text}"{close_bracket}:::{node_type}')
 
         # 2. エッジ（線）の定義
         for edge in graph.edges: